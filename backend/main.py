@@ -1,18 +1,42 @@
-from fastapi import FastAPI, HTTPException, status, Request
+from fastapi import FastAPI, HTTPException, Query, status, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from fastapi.exceptions import RequestValidationError
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field, StringConstraints, validator
+from typing import Annotated, Iterator, Optional, List
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from cachetools import TTLCache
 import boto3
-from boto3.dynamodb.conditions import Key
+import orjson
+from boto3.dynamodb.conditions import Attr
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.config import Config
 from botocore.exceptions import ClientError
+import asyncio
 import os
+import time
 import uuid
 import logging
 
+# Use the libuv-based event loop when available (not supported on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+if uvloop is not None:
+    try:
+        # Already inside a server loop (e.g. Uvicorn picks uvloop itself)
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        # uvloop's policy never creates a loop on demand, but Mangum calls
+        # asyncio.get_event_loop() on every Lambda invocation
+        asyncio.set_event_loop(uvloop.new_event_loop())
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -25,7 +49,10 @@ app = FastAPI(
 
 # CORS Configuration
 # Configure allowed origins based on environment
-allowed_origins = os.getenv('ALLOWED_ORIGINS', '*').split(',')
+allowed_origins = [origin.strip() for origin in os.getenv('ALLOWED_ORIGINS', '*').split(',') if origin.strip()]
+# A bare wildcard keeps CORSMiddleware on its allow-all fast path
+if '*' in allowed_origins:
+    allowed_origins = ['*']
 
 app.add_middleware(
     CORSMiddleware,
@@ -50,7 +77,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             "type": error["type"]
         })
     
-    logger.warning(f"Validation error: {errors}")
+    logger.warning("Validation error: %s", errors)
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
@@ -63,7 +90,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle unexpected errors"""
-    logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
+    logger.error("Unexpected error: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
@@ -73,14 +100,60 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 # DynamoDB setup with error handling
+# boto3 is synchronous, so handlers run each call via run_in_threadpool to
+# keep the event loop free while waiting on DynamoDB
+# Shared client config: a larger keep-alive connection pool avoids new TLS
+# handshakes per request and pool exhaustion under concurrent load
+boto_config = Config(
+    max_pool_connections=int(os.getenv('DYNAMODB_MAX_POOL_CONNECTIONS', '50')),
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+)
+
 try:
-    dynamodb = boto3.resource('dynamodb', region_name=os.getenv('AWS_REGION', 'us-east-1'))
+    region_name = os.getenv('AWS_REGION', 'us-east-1')
+    dynamodb = boto3.resource('dynamodb', region_name=region_name, config=boto_config)
+    # Low-level client for the hot read paths; it skips the resource layer's
+    # per-call parameter and response transformation
+    dynamodb_client = boto3.client('dynamodb', region_name=region_name, config=boto_config)
     table_name = os.getenv('DYNAMODB_TABLE_NAME', 'events-table')
+    status_index_name = os.getenv('DYNAMODB_STATUS_INDEX_NAME', 'status-index')
     table = dynamodb.Table(table_name)
-    logger.info(f"Connected to DynamoDB table: {table_name}")
+    logger.info("Connected to DynamoDB table: %s", table_name)
 except Exception as e:
-    logger.error(f"Failed to connect to DynamoDB: {str(e)}")
+    logger.error("Failed to connect to DynamoDB: %s", e)
     table = None
+    dynamodb_client = None
+
+deserializer = TypeDeserializer()
+
+
+def deserialize_item(item: dict) -> dict:
+    """Convert a low-level DynamoDB item into plain Python values"""
+    # capacity is always an integer, so skip the Decimal round-trip for it
+    return {
+        key: int(value['N']) if key == 'capacity' else deserializer.deserialize(value)
+        for key, value in item.items()
+    }
+
+
+# Short-lived per-worker cache for hot GET /events/{event_id} reads. Writes
+# through this worker invalidate their entry; other workers may serve an
+# event up to the TTL old.
+event_cache = TTLCache(
+    maxsize=int(os.getenv('EVENT_CACHE_MAX_SIZE', '10000')),
+    ttl=float(os.getenv('EVENT_CACHE_TTL_SECONDS', '5'))
+)
+# GET reads still awaiting DynamoDB, by event ID. A write marks them stale
+# so a read that fetched the item before the write cannot re-cache it after.
+_inflight_event_reads = {}
+
+
+def invalidate_cached_event(event_id: str) -> None:
+    """Drop an event from the cache and stop in-flight reads re-caching it"""
+    event_cache.pop(event_id, None)
+    for read in _inflight_event_reads.get(event_id, ()):
+        read['stale'] = True
 
 
 class EventStatus(str, Enum):
@@ -91,33 +164,40 @@ class EventStatus(str, Enum):
     ACTIVE = "active"
 
 
+# Text fields are stripped and length-checked inside pydantic-core rather than
+# in a Python validator; min_length applies after stripping
+TitleStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=200)]
+DescriptionStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=2000)]
+LocationStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=500)]
+OrganizerStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=200)]
+# DynamoDB rejects empty key values, so catch them as validation errors
+EventIdStr = Annotated[str, StringConstraints(min_length=1)]
+
+
+@lru_cache(maxsize=4096)
+def parse_event_date(value: str) -> datetime:
+    """Parse an ISO 8601 event date, caching results for repeated values"""
+    return datetime.fromisoformat(value)
+
+
 class EventBase(BaseModel):
-    title: str = Field(..., min_length=1, max_length=200, description="Event title")
-    description: str = Field(..., min_length=1, max_length=2000, description="Event description")
+    title: TitleStr = Field(..., description="Event title")
+    description: DescriptionStr = Field(..., description="Event description")
     date: str = Field(..., description="Event date in ISO format (YYYY-MM-DD or ISO 8601)")
-    location: str = Field(..., min_length=1, max_length=500, description="Event location")
+    location: LocationStr = Field(..., description="Event location")
     capacity: int = Field(..., gt=0, le=100000, description="Maximum number of attendees")
-    organizer: str = Field(..., min_length=1, max_length=200, description="Event organizer name")
+    organizer: OrganizerStr = Field(..., description="Event organizer name")
     status: EventStatus = EventStatus.DRAFT
     
-    @validator('title', 'description', 'location', 'organizer')
-    def strip_whitespace(cls, v):
-        """Strip leading/trailing whitespace"""
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                raise ValueError("Field cannot be empty or only whitespace")
-        return v
-    
     @validator('date')
     def validate_date(cls, v):
         """Validate date format and ensure it's not in the past"""
         try:
             # Try parsing as ISO format
-            event_date = datetime.fromisoformat(v.replace('Z', '+00:00'))
+            event_date = parse_event_date(v)
             # Check if date is not too far in the past (allow some flexibility for testing)
             if event_date.date() < datetime.utcnow().date():
-                logger.warning(f"Event date {v} is in the past")
+                logger.warning("Event date %s is in the past", v)
             return v
         except ValueError:
             raise ValueError("Date must be in valid ISO format (e.g., 2024-12-31 or 2024-12-31T10:00:00)")
@@ -128,12 +208,12 @@ class EventCreate(EventBase):
 
 
 class EventUpdate(BaseModel):
-    title: Optional[str] = Field(None, min_length=1, max_length=200)
-    description: Optional[str] = Field(None, max_length=2000)
+    title: Optional[TitleStr] = None
+    description: Optional[DescriptionStr] = None
     date: Optional[str] = None
-    location: Optional[str] = Field(None, min_length=1, max_length=500)
+    location: Optional[LocationStr] = None
     capacity: Optional[int] = Field(None, gt=0)
-    organizer: Optional[str] = Field(None, min_length=1, max_length=200)
+    organizer: Optional[OrganizerStr] = None
     status: Optional[EventStatus] = None
 
 
@@ -143,6 +223,19 @@ class Event(EventBase):
     updatedAt: str
 
 
+class EventBatchGet(BaseModel):
+    eventIds: List[EventIdStr] = Field(..., min_length=1, max_length=1000, description="IDs of the events to fetch")
+
+
+def event_from_item(item: dict) -> Event:
+    """Build an Event from a stored DynamoDB item without re-validating it"""
+    # Items are written by this API, so only the non-string attributes need
+    # converting back (boto3 returns numbers as Decimal)
+    return Event.model_construct(
+        **{**item, 'capacity': int(item['capacity']), 'status': EventStatus(item['status'])}
+    )
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information"""
@@ -157,6 +250,12 @@ async def root():
     }
 
 
+# DescribeTable has a low account-wide rate limit, so the health check reuses
+# its last DynamoDB probe result for this many seconds
+HEALTH_CHECK_INTERVAL = 30
+_last_health_check = {'checked_at': None, 'status': None}
+
+
 @app.get("/health")
 async def health():
     """Health check endpoint"""
@@ -164,12 +263,18 @@ async def health():
     
     # Try a simple DynamoDB operation to verify connectivity
     if table is not None:
-        try:
-            table.table_status
-            db_status = "healthy"
-        except Exception as e:
-            logger.error(f"DynamoDB health check failed: {str(e)}")
-            db_status = "unhealthy"
+        now = time.monotonic()
+        checked_at = _last_health_check['checked_at']
+        if checked_at is not None and now - checked_at < HEALTH_CHECK_INTERVAL:
+            db_status = _last_health_check['status']
+        else:
+            try:
+                await run_in_threadpool(dynamodb_client.describe_table, TableName=table_name)
+                db_status = "healthy"
+            except Exception as e:
+                logger.error("DynamoDB health check failed: %s", e)
+                db_status = "unhealthy"
+            _last_health_check.update(checked_at=now, status=db_status)
     
     return {
         "status": "healthy" if db_status == "healthy" else "degraded",
@@ -205,27 +310,68 @@ async def create_event(event: EventCreate):
     }
     
     try:
-        table.put_item(Item=item)
-        logger.info(f"Created event: {event_id}")
+        await run_in_threadpool(table.put_item, Item=item)
+        invalidate_cached_event(event_id)
+        logger.info("Created event: %s", event_id)
         return Event(**item)
     except ClientError as e:
         error_code = e.response['Error']['Code']
-        logger.error(f"DynamoDB ClientError creating event: {error_code} - {str(e)}")
+        logger.error("DynamoDB ClientError creating event: %s - %s", error_code, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database error: {error_code}"
         )
     except Exception as e:
-        logger.error(f"Unexpected error creating event: {str(e)}")
+        logger.error("Unexpected error creating event: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create event"
         )
 
 
-@app.get("/events", response_model=List[Event])
+def stream_event_pages(first_page: dict, pages: Iterator[dict]) -> Iterator[bytes]:
+    """Yield a JSON array of events one DynamoDB page at a time"""
+    yield b"["
+    separator = b""
+    count = 0
+    page = first_page
+    try:
+        while page is not None:
+            items = page.get('Items', [])
+            if items:
+                yield separator + b",".join(orjson.dumps(deserialize_item(item)) for item in items)
+                separator = b","
+                count += len(items)
+            page = next(pages, None)
+    except Exception as e:
+        # The 200 status is already sent; re-raise so the server aborts the
+        # response instead of finishing a truncated (invalid) JSON body
+        logger.error("Error streaming events after %d items: %s", count, e)
+        raise
+    yield b"]"
+    logger.info("Listed %d events", count)
+
+
+def read_event_pages(pages: Iterator[dict]) -> List[dict]:
+    """Read every remaining DynamoDB page into a list of plain item dicts"""
+    return [deserialize_item(item) for page in pages for item in page.get('Items', [])]
+
+
+# Mangum buffers the whole response body on Lambda, so streaming there only
+# means a failed later page can no longer become a 500
+STREAM_LIST_RESPONSES = not os.getenv('AWS_LAMBDA_FUNCTION_NAME')
+
+
+# Items are encoded with orjson straight from DynamoDB pages without building
+# an Event per item; outside Lambda they are streamed page by page
+@app.get(
+    "/events",
+    response_model=None,
+    responses={200: {"model": List[Event]}}
+)
 async def list_events(
-    status: Optional[EventStatus] = None,
+    # Aliased so the parameter does not shadow fastapi's status module
+    status_filter: Optional[EventStatus] = Query(None, alias="status"),
     limit: int = 100
 ):
     """List all events with optional status filter"""
@@ -243,138 +389,244 @@ async def list_events(
         )
     
     try:
-        if status:
-            response = table.scan(
-                FilterExpression=Key('status').eq(status.value),
-                Limit=limit
-            )
+        if status_filter:
+            paginator = dynamodb_client.get_paginator('query')
+            read_kwargs = {
+                'TableName': table_name,
+                'IndexName': status_index_name,
+                'KeyConditionExpression': '#status = :status',
+                'ExpressionAttributeNames': {'#status': 'status'},
+                'ExpressionAttributeValues': {':status': {'S': status_filter.value}},
+            }
         else:
-            response = table.scan(Limit=limit)
+            paginator = dynamodb_client.get_paginator('scan')
+            read_kwargs = {'TableName': table_name}
+        
+        # The paginator follows LastEvaluatedKey (pages can hold fewer than
+        # PageSize items due to the 1 MB cap) and stops after limit items
+        pages = iter(paginator.paginate(
+            **read_kwargs,
+            PaginationConfig={'MaxItems': limit, 'PageSize': limit}
+        ))
+        if not STREAM_LIST_RESPONSES:
+            items = await run_in_threadpool(read_event_pages, pages)
+            logger.info("Listed %d events", len(items))
+            return ORJSONResponse(content=items)
         
-        items = response.get('Items', [])
-        logger.info(f"Listed {len(items)} events")
-        return [Event(**item) for item in items]
+        # Fetch the first page before responding so errors still map to 500
+        first_page = await run_in_threadpool(next, pages, None)
+        return StreamingResponse(
+            stream_event_pages(first_page, pages),
+            media_type="application/json"
+        )
     except ClientError as e:
         error_code = e.response['Error']['Code']
-        logger.error(f"DynamoDB ClientError listing events: {error_code} - {str(e)}")
+        logger.error("DynamoDB ClientError listing events: %s - %s", error_code, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database error: {error_code}"
         )
     except Exception as e:
-        logger.error(f"Unexpected error listing events: {str(e)}")
+        logger.error("Unexpected error listing events: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list events"
         )
 
 
-@app.get("/events/{event_id}", response_model=Event)
-async def get_event(event_id: str):
-    """Get a specific event by ID"""
+# BatchGetItem accepts at most 100 keys per request
+BATCH_GET_MAX_KEYS = 100
+BATCH_GET_MAX_RETRIES = 5
+BATCH_GET_BASE_DELAY = 0.05
+
+
+async def batch_get_chunk(event_ids: List[str]) -> List[dict]:
+    """Fetch up to 100 events, retrying unprocessed keys with exponential backoff"""
+    request_items = {table_name: {'Keys': [{'eventId': event_id} for event_id in event_ids]}}
+    items = []
+    attempt = 0
+    while True:
+        response = await run_in_threadpool(dynamodb.batch_get_item, RequestItems=request_items)
+        items.extend(response.get('Responses', {}).get(table_name, []))
+        request_items = response.get('UnprocessedKeys')
+        if not request_items:
+            return items
+        if attempt >= BATCH_GET_MAX_RETRIES:
+            logger.warning("Batch get left unprocessed keys after %d retries", attempt)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Some events could not be retrieved. Please retry"
+            )
+        await asyncio.sleep(BATCH_GET_BASE_DELAY * 2 ** attempt)
+        attempt += 1
+
+
+@app.post("/events/batch", response_model=List[Event])
+async def batch_get_events(batch: EventBatchGet):
+    """Get multiple events by ID in as few round-trips as possible"""
     if table is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Database service is unavailable"
         )
     
+    # BatchGetItem rejects duplicate keys, so dedupe while keeping request order
+    event_ids = list(dict.fromkeys(batch.eventIds))
+    chunks = [
+        event_ids[i:i + BATCH_GET_MAX_KEYS]
+        for i in range(0, len(event_ids), BATCH_GET_MAX_KEYS)
+    ]
+    
     try:
-        response = table.get_item(Key={'eventId': event_id})
+        results = await asyncio.gather(*(batch_get_chunk(chunk) for chunk in chunks))
         
-        if 'Item' not in response:
-            logger.warning(f"Event not found: {event_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Event with ID {event_id} not found"
-            )
-        
-        logger.info(f"Retrieved event: {event_id}")
-        return Event(**response['Item'])
+        # BatchGetItem returns items in no particular order; missing IDs are skipped
+        found = {item['eventId']: item for items in results for item in items}
+        logger.info("Batch retrieved %d of %d events", len(found), len(event_ids))
+        return [event_from_item(found[event_id]) for event_id in event_ids if event_id in found]
     except HTTPException:
         raise
     except ClientError as e:
         error_code = e.response['Error']['Code']
-        logger.error(f"DynamoDB ClientError getting event: {error_code} - {str(e)}")
+        logger.error("DynamoDB ClientError batch getting events: %s - %s", error_code, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database error: {error_code}"
         )
     except Exception as e:
-        logger.error(f"Unexpected error getting event: {str(e)}")
+        logger.error("Unexpected error batch getting events: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to get event"
+            detail="Failed to get events"
         )
 
 
-@app.put("/events/{event_id}", response_model=Event)
-async def update_event(event_id: str, event_update: EventUpdate):
-    """Update an existing event"""
+@app.get("/events/{event_id}", response_model=Event)
+async def get_event(event_id: str):
+    """Get a specific event by ID"""
     if table is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Database service is unavailable"
         )
     
-    # Build update expression
-    update_data = event_update.model_dump(exclude_unset=True)
-    if not update_data:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No fields to update. Provide at least one field to update"
-        )
+    cached_event = event_cache.get(event_id)
+    if cached_event is not None:
+        return cached_event
     
-    # First check if event exists
+    read = {'stale': False}
+    _inflight_event_reads.setdefault(event_id, []).append(read)
     try:
-        response = table.get_item(Key={'eventId': event_id})
+        response = await run_in_threadpool(
+            dynamodb_client.get_item,
+            TableName=table_name,
+            Key={'eventId': {'S': event_id}}
+        )
+        
         if 'Item' not in response:
-            logger.warning(f"Event not found for update: {event_id}")
+            logger.warning("Event not found: %s", event_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Event with ID {event_id} not found"
             )
+        
+        logger.info("Retrieved event: %s", event_id)
+        event = event_from_item(deserialize_item(response['Item']))
+        if not read['stale']:
+            event_cache[event_id] = event
+        return event
     except HTTPException:
         raise
     except ClientError as e:
         error_code = e.response['Error']['Code']
-        logger.error(f"DynamoDB ClientError checking event: {error_code} - {str(e)}")
+        logger.error("DynamoDB ClientError getting event: %s - %s", error_code, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database error: {error_code}"
         )
     except Exception as e:
-        logger.error(f"Unexpected error checking event: {str(e)}")
+        logger.error("Unexpected error getting event: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to check event"
+            detail="Failed to get event"
+        )
+    finally:
+        reads = _inflight_event_reads[event_id]
+        reads.remove(read)
+        if not reads:
+            del _inflight_event_reads[event_id]
+
+
+# Expression attribute name/value placeholders for every updatable field
+UPDATE_PLACEHOLDERS = {
+    field: (f"#{field}", f":{field}")
+    for field in (*EventUpdate.model_fields, 'updatedAt')
+}
+
+
+@app.put("/events/{event_id}", response_model=Event)
+async def update_event(event_id: str, event_update: EventUpdate):
+    """Update an existing event"""
+    if table is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database service is unavailable"
+        )
+    
+    # Build update expression
+    # mode='json' serializes the status enum to its value in pydantic-core;
+    # explicit nulls are dropped so they never overwrite stored attributes
+    # (status is the status-index key and capacity must stay a number)
+    update_data = event_update.model_dump(exclude_unset=True, exclude_none=True, mode='json')
+    if not update_data:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No fields to update. Provide at least one field to update"
         )
     
     update_data['updatedAt'] = datetime.utcnow().isoformat()
     
-    update_expression = "SET " + ", ".join([f"#{k} = :{k}" for k in update_data.keys()])
-    expression_attribute_names = {f"#{k}": k for k in update_data.keys()}
-    expression_attribute_values = {f":{k}": v.value if isinstance(v, EventStatus) else v for k, v in update_data.items()}
+    update_parts = []
+    expression_attribute_names = {}
+    expression_attribute_values = {}
+    for field, value in update_data.items():
+        name, placeholder = UPDATE_PLACEHOLDERS[field]
+        update_parts.append(f"{name} = {placeholder}")
+        expression_attribute_names[name] = field
+        expression_attribute_values[placeholder] = value
+    update_expression = "SET " + ", ".join(update_parts)
     
     try:
-        response = table.update_item(
+        response = await run_in_threadpool(
+            table.update_item,
             Key={'eventId': event_id},
             UpdateExpression=update_expression,
             ExpressionAttributeNames=expression_attribute_names,
             ExpressionAttributeValues=expression_attribute_values,
+            # Fail instead of creating a new item so a missing event costs
+            # one round-trip rather than a separate get_item check
+            ConditionExpression=Attr('eventId').exists(),
             ReturnValues='ALL_NEW'
         )
         
-        logger.info(f"Updated event: {event_id}")
-        return Event(**response['Attributes'])
+        invalidate_cached_event(event_id)
+        logger.info("Updated event: %s", event_id)
+        return event_from_item(response['Attributes'])
     except ClientError as e:
         error_code = e.response['Error']['Code']
-        logger.error(f"DynamoDB ClientError updating event: {error_code} - {str(e)}")
+        if error_code == 'ConditionalCheckFailedException':
+            logger.warning("Event not found for update: %s", event_id)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Event with ID {event_id} not found"
+            )
+        logger.error("DynamoDB ClientError updating event: %s - %s", error_code, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database error: {error_code}"
         )
     except Exception as e:
-        logger.error(f"Unexpected error updating event: {str(e)}")
+        logger.error("Unexpected error updating event: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update event"
@@ -391,28 +643,29 @@ async def delete_event(event_id: str):
         )
     
     try:
-        response = table.get_item(Key={'eventId': event_id})
-        if 'Item' not in response:
-            logger.warning(f"Event not found for deletion: {event_id}")
+        await run_in_threadpool(
+            table.delete_item,
+            Key={'eventId': event_id},
+            ConditionExpression=Attr('eventId').exists()
+        )
+        invalidate_cached_event(event_id)
+        logger.info("Deleted event: %s", event_id)
+        return None
+    except ClientError as e:
+        error_code = e.response['Error']['Code']
+        if error_code == 'ConditionalCheckFailedException':
+            logger.warning("Event not found for deletion: %s", event_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Event with ID {event_id} not found"
             )
-        
-        table.delete_item(Key={'eventId': event_id})
-        logger.info(f"Deleted event: {event_id}")
-        return None
-    except HTTPException:
-        raise
-    except ClientError as e:
-        error_code = e.response['Error']['Code']
-        logger.error(f"DynamoDB ClientError deleting event: {error_code} - {str(e)}")
+        logger.error("DynamoDB ClientError deleting event: %s - %s", error_code, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database error: {error_code}"
         )
     except Exception as e:
-        logger.error(f"Unexpected error deleting event: {str(e)}")
+        logger.error("Unexpected error deleting event: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete event"
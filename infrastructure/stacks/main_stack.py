@@ -14,6 +14,11 @@ import os
 
 
 class MainStack(Stack):
+    def _int_context(self, key: str, default: int) -> int:
+        """Read an integer CDK context value, using the default only when unset"""
+        value = self.node.try_get_context(key)
+        return default if value is None else int(value)
+
     def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
@@ -30,13 +35,29 @@ class MainStack(Stack):
             point_in_time_recovery=True,
         )
 
+        # GSI for querying events by status without a full table scan
+        events_table.add_global_secondary_index(
+            index_name="status-index",
+            partition_key=dynamodb.Attribute(
+                name="status",
+                type=dynamodb.AttributeType.STRING
+            ),
+            projection_type=dynamodb.ProjectionType.ALL,
+        )
+
+        # Optional hard cap on concurrent executions: the Function URL below is
+        # not throttled by API Gateway, so this bounds load from either endpoint.
+        # Off by default because Lambda rejects reservations that leave fewer
+        # than 10 unreserved executions in the account.
+        reserved_concurrency = self._int_context("lambda_reserved_concurrency", 0)
+
         # Lambda Function with bundled dependencies
         api_lambda = _lambda.Function(
             self,
             "EventsAPIFunction",
             runtime=_lambda.Runtime.PYTHON_3_12,
             handler="main.handler",
-            architecture=_lambda.Architecture.X86_64,
+            architecture=_lambda.Architecture.ARM_64,
             code=_lambda.Code.from_asset(
                 "../backend",
                 bundling=BundlingOptions(
@@ -44,12 +65,13 @@ class MainStack(Stack):
                     platform="linux/amd64",
                     command=[
                         "bash", "-c",
-                        "pip install --platform manylinux2014_x86_64 --only-binary=:all: -r requirements.txt -t /asset-output && cp -au . /asset-output"
+                        "pip install --platform manylinux2014_aarch64 --only-binary=:all: -r requirements.txt -t /asset-output && cp -au . /asset-output"
                     ],
                 )
             ),
             timeout=Duration.seconds(30),
             memory_size=512,
+            reserved_concurrent_executions=reserved_concurrency or None,
             environment={
                 "DYNAMODB_TABLE_NAME": events_table.table_name,
                 "ALLOWED_ORIGINS": "*",  # Configure for production
@@ -59,12 +81,31 @@ class MainStack(Stack):
         # Grant DynamoDB permissions to Lambda
         events_table.grant_read_write_data(api_lambda)
 
+        # Published alias with warm instances so requests skip the cold start
+        # (FastAPI, pydantic schema building and boto3 imports)
+        # 0 disables provisioned concurrency (and its always-on cost)
+        provisioned_concurrency = self._int_context("lambda_provisioned_concurrency", 2)
+        api_alias = _lambda.Alias(
+            self,
+            "EventsAPIFunctionLiveAlias",
+            alias_name="live",
+            version=api_lambda.current_version,
+            provisioned_concurrent_executions=provisioned_concurrency or None,
+        )
+
+        # API Gateway limits, overridable with `cdk deploy -c <key>=<value>`
+        throttling_rate_limit = self._int_context("api_throttling_rate_limit", 1000)
+        throttling_burst_limit = self._int_context("api_throttling_burst_limit", 2000)
+        # Writes do not invalidate the gateway cache, so keep its TTL in line with
+        # the app's 5 s in-process event cache by default
+        cache_ttl_seconds = self._int_context("api_cache_ttl_seconds", 5)
+
         # API Gateway
         api = apigw.LambdaRestApi(
             self,
             "EventsAPI",
-            handler=api_lambda,
-            proxy=True,
+            handler=api_alias,
+            proxy=False,
             default_cors_preflight_options=apigw.CorsOptions(
                 allow_origins=apigw.Cors.ALL_ORIGINS,
                 allow_methods=apigw.Cors.ALL_METHODS,
@@ -72,11 +113,58 @@ class MainStack(Stack):
             ),
             deploy_options=apigw.StageOptions(
                 stage_name="prod",
-                throttling_rate_limit=100,
-                throttling_burst_limit=200,
+                throttling_rate_limit=throttling_rate_limit,
+                throttling_burst_limit=throttling_burst_limit,
+                cache_cluster_enabled=True,
+                cache_cluster_size="0.5",
+                # Only proxied GETs are cached; writes and /health always hit Lambda
+                method_options={
+                    "/{proxy+}/GET": apigw.MethodDeploymentOptions(
+                        caching_enabled=True,
+                        cache_ttl=Duration.seconds(cache_ttl_seconds),
+                    ),
+                },
             ),
         )
 
+        api.root.add_method("ANY")
+        api.root.add_resource("health").add_method("GET")
+
+        # Plain resource rather than add_proxy(), which would also copy the
+        # cached GET method (and its proxy path parameter) onto the root
+        proxy_resource = api.root.add_resource("{proxy+}")
+        proxy_resource.add_method("ANY")
+        # Cache GET responses per path and list query parameters so different
+        # events and filters never share a cache entry. Origin is part of the
+        # key too: CORSMiddleware's Access-Control-Allow-Origin depends on it,
+        # and API Gateway ignores the Vary: Origin response header.
+        proxy_resource.add_method(
+            "GET",
+            apigw.LambdaIntegration(
+                api_alias,
+                cache_key_parameters=[
+                    "method.request.path.proxy",
+                    "method.request.querystring.status",
+                    "method.request.querystring.limit",
+                    "method.request.header.Origin",
+                ],
+            ),
+            request_parameters={
+                "method.request.path.proxy": True,
+                "method.request.querystring.status": False,
+                "method.request.querystring.limit": False,
+                "method.request.header.Origin": False,
+            },
+        )
+
+        # Function URL: direct HTTPS endpoint that skips the API Gateway hop.
+        # It has no API Gateway throttling or caching; only the function's
+        # reserved concurrency (if set) limits it. CORS is left to the app's
+        # CORSMiddleware (ALLOWED_ORIGINS). Mangum handles the v2 payload.
+        function_url = api_alias.add_function_url(
+            auth_type=_lambda.FunctionUrlAuthType.NONE,
+        )
+
         # Outputs
         CfnOutput(
             self,
@@ -85,6 +173,13 @@ class MainStack(Stack):
             description="API Gateway endpoint URL",
         )
 
+        CfnOutput(
+            self,
+            "FunctionURLEndpoint",
+            value=function_url.url,
+            description="Lambda Function URL (bypasses API Gateway)",
+        )
+
         CfnOutput(
             self,
             "DynamoDBTableName",